@@ -64,17 +64,22 @@ class CdCompleter(Completer):
                     return directories
 
             # Now search in the final directory for the last part
-            last_part = pattern_parts[-1]
+            # Lowercase the pattern once and each name once; the lowered name is
+            # reused as the sort key instead of being recomputed by sorted()
+            last_part = pattern_parts[-1].lower()
+            matches: list[tuple[str, Path]] = []
             try:
                 for item in search_path.iterdir():
                     if item.is_dir():
+                        name = item.name.lower()
                         # Match if name starts with last_part or if last_part is empty
-                        if not last_part or item.name.lower().startswith(last_part.lower()):
-                            directories.append(item)
+                        if name.startswith(last_part):
+                            matches.append((name, item))
             except (PermissionError, OSError):
                 pass
 
-            return sorted(directories, key=lambda p: p.name.lower())
+            matches.sort(key=lambda match: match[0])
+            return [item for _, item in matches]
 
         except Exception:
             return directories
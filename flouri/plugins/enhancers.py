@@ -67,6 +67,28 @@ class LsColorEnhancer(CommandEnhancer):
     MAGENTA = "\033[35m"  # Images/media
     RED = "\033[31m"  # Errors
 
+    # Extension -> color, so a file's color is one dict lookup instead of
+    # a membership test per category
+    EXTENSION_COLORS = {
+        **dict.fromkeys((".zip", ".tar", ".gz", ".bz2", ".xz", ".7z", ".rar"), YELLOW),
+        **dict.fromkeys(
+            (
+                ".jpg",
+                ".jpeg",
+                ".png",
+                ".gif",
+                ".bmp",
+                ".svg",
+                ".mp4",
+                ".avi",
+                ".mkv",
+                ".mp3",
+                ".wav",
+            ),
+            MAGENTA,
+        ),
+    }
+
     def name(self) -> str:
         """Return the enhancer name."""
         return "ls_color"
@@ -96,26 +118,8 @@ class LsColorEnhancer(CommandEnhancer):
                 # Check if executable
                 if os.access(full_path, os.X_OK):
                     return self.GREEN
-                # Check extension for common file types
-                ext = full_path.suffix.lower()
-                # Archives
-                if ext in {".zip", ".tar", ".gz", ".bz2", ".xz", ".7z", ".rar"}:
-                    return self.YELLOW
-                # Images/media
-                if ext in {
-                    ".jpg",
-                    ".jpeg",
-                    ".png",
-                    ".gif",
-                    ".bmp",
-                    ".svg",
-                    ".mp4",
-                    ".avi",
-                    ".mkv",
-                    ".mp3",
-                    ".wav",
-                }:
-                    return self.MAGENTA
+                # Check extension for common file types (archives, images/media)
+                return self.EXTENSION_COLORS.get(full_path.suffix.lower(), self.RESET)
             return self.RESET
         except Exception:
             return self.RESET
@@ -256,6 +260,17 @@ class EnhancerManager:
         """
         self.enhancers.append(enhancer)
 
+    def should_enhance(self, command: str) -> bool:
+        """Check if any registered enhancer should enhance the given command.
+
+        Args:
+            command: The command string to check.
+
+        Returns:
+            True if at least one enhancer applies, False otherwise.
+        """
+        return any(enhancer.should_enhance(command) for enhancer in self.enhancers)
+
     def enhance(
         self, command: str, stdout: str, stderr: str, exit_code: int, cwd: str
     ) -> dict[str, Any]:
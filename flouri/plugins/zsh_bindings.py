@@ -20,20 +20,21 @@ class ZshBindingsPlugin(Plugin):
         # Handle: cd (alone), cd with 3+ dots (..., ...., etc.)
         if cmd == "cd":
             return True
-        if cmd.startswith("cd "):
-            parts = cmd.split()
-            if len(parts) == 2:
-                path = parts[1]
-                # Check if it's a dots pattern with 3+ dots
-                clean_path = path.replace("/", "")
-                if clean_path and all(c == "." for c in clean_path) and len(clean_path) >= 3:
-                    return True
+        # partition() splits off the argument without building a list of words
+        name, _, path = cmd.partition(" ")
+        if name == "cd":
+            # Check if it's a dots pattern with 3+ dots (strip(".") leaves nothing
+            # behind exactly when every character is a dot, scanning in C)
+            clean_path = path.strip().replace("/", "")
+            if clean_path and not clean_path.strip(".") and len(clean_path) >= 3:
+                return True
         return False
 
     async def execute(self, command: str, cwd: str) -> dict[str, Any]:
         """Execute zsh-like command bindings."""
         cmd = command.strip()
-        parts = cmd.split()
+        name, _, path = cmd.partition(" ")
+        path = path.strip()
 
         try:
             if cmd == "cd":
@@ -48,14 +49,13 @@ class ZshBindingsPlugin(Plugin):
                     "new_cwd": str(home),
                 }
 
-            elif len(parts) == 2 and parts[0] == "cd":
-                path = parts[1]
+            elif name == "cd" and path:
                 current = Path(cwd)
 
                 # Check if it's a dots pattern (cd ... or cd ....)
                 # Remove slashes and check if it's all dots
                 clean_path = path.replace("/", "")
-                if clean_path and all(c == "." for c in clean_path):
+                if clean_path and not clean_path.strip("."):
                     dot_count = len(clean_path)
                     if dot_count >= 3:  # cd ... or more
                         # Calculate how many directories to go back
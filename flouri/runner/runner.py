@@ -60,7 +60,9 @@ async def run_agent(
     content = types.Content(role="user", parts=[types.Part(text=prompt)])
 
     final_response_text = ""
-    output_parts = []
+    # Insertion-ordered dict: repeated parts are dropped as they arrive instead
+    # of in a second pass over a list
+    output_parts: dict[str, None] = {}
 
     try:
         async for event in runner.run_async(
@@ -93,16 +95,16 @@ async def run_agent(
                                 # Show execution output
                                 output = result.output.strip()
                                 if output:
-                                    output_parts.append(output)
+                                    output_parts[output] = None
                         else:
                             # Show error output clearly
                             error_msg = result.output if result.output else "Execution failed"
-                            output_parts.append(f"❌ Error: {error_msg}")
+                            output_parts[f"❌ Error: {error_msg}"] = None
                     # Handle text parts (always process these)
                     elif hasattr(part, "text") and part.text:
                         text = part.text.strip()
                         if text:
-                            output_parts.append(text)
+                            output_parts[text] = None
                             # Also track for final response
                             if event.is_final_response():
                                 final_response_text = text
@@ -110,21 +112,13 @@ async def run_agent(
     except Exception as e:
         raise RuntimeError(f"Error during agent run: {e}") from e
 
-    # Combine all output parts
+    # Combine all output parts (already de-duplicated, in order of arrival)
     if output_parts:
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_parts = []
-        for part in output_parts:
-            if part not in seen:
-                seen.add(part)
-                unique_parts.append(part)
-
         # If we have a final response that's not already in parts, add it
-        if final_response_text and final_response_text not in seen:
-            unique_parts.append(final_response_text)
+        if final_response_text:
+            output_parts.setdefault(final_response_text)
 
-        response = "\n\n".join(unique_parts)
+        response = "\n\n".join(output_parts)
     else:
         response = final_response_text if final_response_text else "No response generated."
 
@@ -186,7 +180,9 @@ async def run_agent_live(
     # Configure for TEXT streaming (not audio)
     run_config = RunConfig(response_modalities=["TEXT"])
 
-    final_response_text = ""
+    # Streamed text arrives in many small chunks; collect them and join once
+    # rather than re-concatenating the growing response on every chunk
+    text_chunks: list[str] = []
     output_parts = []
 
     try:
@@ -202,7 +198,7 @@ async def run_agent_live(
                     # Handle text parts first (for streaming)
                     if hasattr(part, "text") and part.text:
                         text = part.text
-                        final_response_text += text
+                        text_chunks.append(text)
                         # Call stream callback if provided
                         if stream_callback:
                             stream_callback(text)
@@ -238,6 +234,8 @@ async def run_agent_live(
     except Exception as e:
         raise RuntimeError(f"Error during agent run: {e}") from e
 
+    final_response_text = "".join(text_chunks)
+
     # Combine all output
     if output_parts:
         if final_response_text:
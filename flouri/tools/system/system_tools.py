@@ -1,6 +1,7 @@
 """System information skill."""
 
 import time
+from datetime import datetime, timezone
 from typing import Any
 
 from ...logging import log_tool_call
@@ -35,19 +36,20 @@ class GetCurrentDatetimeTool(Tool):
         Returns:
             A dictionary with current date, time, timezone, and ISO format timestamp.
         """
-        from datetime import datetime, timezone
-
         t0 = time.perf_counter()
         # Use timezone.utc for Python 3.10+ compatibility (UTC alias requires 3.11+)
         now = datetime.now(timezone.utc)  # noqa: UP017
         local_now = datetime.now()
+        # Format the local timestamp once; date and time are its two halves
+        local_datetime = local_now.strftime("%Y-%m-%d %H:%M:%S")
+        date, _, time_of_day = local_datetime.partition(" ")
 
         result: dict[str, Any] = {
             "status": "success",
             "iso_timestamp": now.isoformat(),
-            "local_datetime": local_now.strftime("%Y-%m-%d %H:%M:%S"),
-            "date": local_now.strftime("%Y-%m-%d"),
-            "time": local_now.strftime("%H:%M:%S"),
+            "local_datetime": local_datetime,
+            "date": date,
+            "time": time_of_day,
             "timezone": str(local_now.astimezone().tzinfo) if local_now.tzinfo else "local",
             "utc_datetime": now.strftime("%Y-%m-%d %H:%M:%S UTC"),
         }
@@ -16,17 +16,14 @@ FLOURISH_BANNER = """
 ╚══════════════════════════════════════════════════════════════════════╝
 """
 
+# Banner lines wrapped in cyan, built once rather than on every (re)print
+_BANNER_LINES = tuple(f"\033[36m{line}\033[0m\n" for line in FLOURISH_BANNER.strip().split("\n"))
+
 
 def animate_banner(speed=0.03):
     """Prints the banner with a vertical scanline effect."""
-    cyan = "\033[36m"
-    reset = "\033[0m"
-
-    lines = FLOURISH_BANNER.strip().split("\n")
-
-    for line in lines:
-        # Print line with cyan color
-        sys.stdout.write(cyan + line + reset + "\n")
+    for line in _BANNER_LINES:
+        sys.stdout.write(line)
         sys.stdout.flush()
         time.sleep(speed)
     print()
@@ -1,17 +1,55 @@
 """CLI interface for Flouri."""
 
+import asyncio
 import sys
 
 import click
 from rich.console import Console
 from rich.markdown import Markdown
 
-from ..runner import run_agent_live_sync, run_agent_sync
 from .tui import run_tui
 
 console = Console()
 error_console = Console(file=sys.stderr, style="bold red")
 
+# Minimum seconds between console writes while streaming (~30 updates per second)
+STREAM_FLUSH_INTERVAL = 0.033
+
+
+class _StreamPrinter:
+    """Stream callback that coalesces text chunks into at most ~30 console writes per second.
+
+    Chunks are buffered and written by a single deferred flush on the running event
+    loop, so a fast token stream costs one render per frame instead of one per token.
+    The runner invokes the callback on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, out: Console):
+        self.out = out
+        self._pending: list[str] = []
+        self._flush_scheduled = False
+
+    def __call__(self, text: str):
+        """Buffer a text chunk and schedule a flush if none is pending."""
+        self._pending.append(text)
+        if self._flush_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to defer to, write immediately
+            self.flush()
+            return
+        self._flush_scheduled = True
+        loop.call_later(STREAM_FLUSH_INTERVAL, self.flush)
+
+    def flush(self):
+        """Write all buffered text to the console."""
+        self._flush_scheduled = False
+        if self._pending:
+            self.out.print("".join(self._pending), end="", markup=False)
+            self._pending.clear()
+
 
 @click.group(invoke_without_command=True)
 @click.version_option(version="0.1.0")
@@ -58,6 +96,10 @@ def agent_command(prompt: str, allowlist: str | None, blacklist: str | None, str
         flouri agent --stream "Explain Docker containers"  # Live streaming output
     """
     try:
+        # The agent stack (google-adk, litellm) takes about a second to import, so it
+        # is loaded only when an agent command actually runs
+        from ..runner import run_agent_live_sync, run_agent_sync
+
         # Parse allowlist and blacklist
         allowed_commands = (
             [cmd.strip() for cmd in allowlist.split(",") if cmd.strip()] if allowlist else None
@@ -70,16 +112,17 @@ def agent_command(prompt: str, allowlist: str | None, blacklist: str | None, str
             # Live streaming mode
             console.print("[bold blue]Agent is working (streaming)...[/bold blue]\n")
 
-            def stream_callback(text: str):
-                """Callback for streaming text chunks."""
-                console.print(text, end="", markup=False)
-
-            response = run_agent_live_sync(
-                prompt,
-                allowed_commands=allowed_commands,
-                blacklisted_commands=blacklisted_commands,
-                stream_callback=stream_callback,
-            )
+            stream_callback = _StreamPrinter(console)
+            try:
+                response = run_agent_live_sync(
+                    prompt,
+                    allowed_commands=allowed_commands,
+                    blacklisted_commands=blacklisted_commands,
+                    stream_callback=stream_callback,
+                )
+            finally:
+                # Write whatever arrived after the last scheduled flush
+                stream_callback.flush()
             console.print()  # New line after streaming
         else:
             # Standard mode
@@ -1,10 +1,16 @@
 """Terminal User Interface for Flouri - AI-enabled terminal environment."""
 
 import asyncio
+import contextlib
+import functools
 import os
 import re
+import signal
 import subprocess
+import sys
+from collections import deque
 from pathlib import Path
+from typing import BinaryIO
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import (
@@ -19,10 +25,11 @@ from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.lexers import PygmentsLexer
 from prompt_toolkit.styles import Style
 from pygments.lexers.shell import BashLexer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.spinner import Spinner
+from rich.style import Style as RichStyle
 from rich.syntax import Syntax
 from rich.text import Text
 
@@ -38,12 +45,50 @@ from ..logging import (
 from ..plugins import PluginManager, ZshBindingsPlugin
 from ..plugins.cd_completer import CdCompleter
 from ..plugins.enhancers import CdEnhancementPlugin, EnhancerManager, LsColorEnhancer
-from ..runner import run_agent
-from ..tools import GLOBAL_CWD, set_allowlist_blacklist  # noqa: F401
+from ..tools import globals as tools_globals
+from ..tools import set_allowlist_blacklist
 from .banner import print_banner
 
 # AI assistance trigger prefix
 AI_PREFIX = "?"
+_AI_PREFIX_LEN = len(AI_PREFIX)
+
+# Commands kept in the in-session history (oldest are evicted in O(1))
+_COMMAND_HISTORY_SIZE = 1000
+
+# Usage hint printed under the banner at startup
+_WELCOME_HINT = (
+    "\033[90m"
+    "Type commands directly, or use '?' prefix for AI assistance\n"
+    "Press Ctrl+D to exit"
+    "\033[0m\n"
+)
+
+# Maximum bytes read from a subprocess pipe per write to the terminal
+_STREAM_CHUNK_SIZE = 64 * 1024
+# Minimum seconds between terminal flushes while streaming (one per 60 Hz frame)
+_STREAM_FLUSH_INTERVAL = 1 / 60
+# Bytes of streamed output kept for the terminal log; older output is dropped
+_STREAM_CAPTURE_BYTES = 16 * 1024 * 1024
+# Prepended to the logged copy when older output was dropped
+_STREAM_TRUNCATED_MARKER = b"[output truncated]\n"
+
+# Fenced code blocks in AI responses: ```lang\n...```
+_CODE_BLOCK_RE = re.compile(r"```(\w+)?\n?(.*?)```", re.DOTALL)
+
+# Rich styles for AI output, built once instead of parsing markup on every print
+_AI_STYLE = RichStyle(color="cyan")
+_ERROR_STYLE = RichStyle(color="red")
+
+# prompt_toolkit style for the completion menu
+_SESSION_STYLE = Style.from_dict(
+    {
+        "completion-menu.completion": "bg:#008888 #ffffff",
+        "completion-menu.completion.current": "bg:#00aaaa #000000",
+        "scrollbar.background": "bg:#88aaaa",
+        "scrollbar.button": "bg:#222222",
+    }
+)
 
 # Common bash commands for auto-completion
 BASH_COMMANDS = [
@@ -91,59 +136,64 @@ BASH_COMMANDS = [
     "man",
     "help",
 ]
+# Set view of BASH_COMMANDS for O(1) membership checks
+_BASH_COMMAND_SET = frozenset(BASH_COMMANDS)
 
 
-def get_git_branch(cwd: Path) -> str:
-    """Get the current git branch name."""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=1,
-        )
-        if result.returncode == 0:
-            branch = result.stdout.strip()
-            return f"({branch})" if branch else ""
-    except Exception:
-        pass
-    return ""
-
+def get_git_info(cwd: Path) -> tuple[str, str]:
+    """Get the git branch and status indicator with a single git invocation.
 
-def get_git_status(cwd: Path) -> str:
-    """Get git status indicator."""
+    Returns:
+        Tuple of (branch, status) where branch is formatted as "(name)" and
+        status is "*" for a dirty tree or "+" for a clean one. Both are empty
+        outside a git repository.
+    """
     try:
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            ["git", "status", "--porcelain", "--branch"],
             cwd=cwd,
             capture_output=True,
             text=True,
             timeout=1,
         )
         if result.returncode == 0:
-            if result.stdout.strip():
-                return "*"  # Has changes
-            return "+"  # Clean
+            header, _, changes = result.stdout.partition("\n")
+            branch = header.removeprefix("## ")
+            for prefix in ("No commits yet on ", "Initial commit on "):
+                branch = branch.removeprefix(prefix)
+            if branch.startswith("HEAD "):
+                branch = "HEAD"  # Detached HEAD
+            branch = branch.partition("...")[0]
+            if not branch:
+                return "", ""
+            return f"({branch})", "*" if changes.strip() else "+"
     except Exception:
         pass
-    return ""
+    return "", ""
 
 
-def format_prompt(cwd: Path):
-    """Format the terminal prompt with git info using prompt_toolkit FormattedText."""
+@functools.lru_cache(maxsize=128)
+def get_display_path(cwd: Path) -> str:
+    """Get the prompt display path for a directory, abbreviating the home directory to ~.
+
+    Memoized per directory, so the home lookup and path arithmetic only run
+    when the prompt moves to a directory it has not shown before.
+    """
     try:
         home = Path.home()
         try:
             rel_path = cwd.relative_to(home)
-            display_path = f"~/{rel_path}" if str(rel_path) != "." else "~"
+            return f"~/{rel_path}" if str(rel_path) != "." else "~"
         except ValueError:
-            display_path = str(cwd)
+            return str(cwd)
     except Exception:
-        display_path = str(cwd)
+        return str(cwd)
 
-    git_branch = get_git_branch(cwd)
-    git_status = get_git_status(cwd) if git_branch else ""
+
+def format_prompt(cwd: Path):
+    """Format the terminal prompt with git info using prompt_toolkit FormattedText."""
+    display_path = get_display_path(cwd)
+    git_branch, git_status = get_git_info(cwd)
 
     # Build formatted text parts
     parts = []
@@ -181,45 +231,38 @@ class BashCompleter(Completer):
         # Commands that take file arguments
         self.file_commands = {"cat", "less", "more", "head", "tail", "grep", "rm", "mv", "cp"}
 
-    def _get_registered_completions(self, document, complete_event, command: str):
-        """Get completions from registered completion functions.
+    def _get_registered_completions(self, completion_func, parts: list[str]):
+        """Get completions from a registered completion function.
 
         Args:
-            document: The document being completed
-            complete_event: The completion event
-            command: The command name
+            completion_func: The CompletionFunction registered for the command
+            parts: The words typed so far
 
         Yields:
             Completion objects
         """
-        completion_func = self.completion_registry.get_completion(command)
-        if completion_func:
-            text_before = document.text_before_cursor
-            text = text_before.strip()
-            parts = text.split()
-
-            # Determine current word and index
-            if parts:
-                # Find which word we're completing
-                word_index = len(parts) - 1
-                current_word = parts[-1] if parts else ""
-            else:
-                word_index = 0
-                current_word = ""
+        # Determine current word and index
+        if parts:
+            # Find which word we're completing
+            word_index = len(parts) - 1
+            current_word = parts[-1]
+        else:
+            word_index = 0
+            current_word = ""
 
-            try:
-                completions = completion_func.func(current_word, parts, word_index)
-                yield from completions
-            except Exception:
-                # If completion function fails, fall back to default
-                pass
+        try:
+            completions = completion_func.func(current_word, parts, word_index)
+            yield from completions
+        except Exception:
+            # If completion function fails, fall back to default
+            pass
 
     def _is_command_complete(self, command: str) -> bool:
         """Check if a command string is a complete known command."""
         if not command:
             return False
         # Check if it's an exact match or ends with a space
-        return command.strip() in BASH_COMMANDS or command.endswith(" ")
+        return command.strip() in _BASH_COMMAND_SET or command.endswith(" ")
 
     def get_completions(self, document, complete_event):
         text_before = document.text_before_cursor
@@ -228,9 +271,10 @@ class BashCompleter(Completer):
 
         # Handle commands with registered completions
         if parts and parts[0]:
-            command = parts[0].lower()
-            if self.completion_registry.has_completion(command):
-                yield from self._get_registered_completions(document, complete_event, command)
+            # Resolve the registry entry once and reuse the already-split words
+            completion_func = self.completion_registry.get_completion(parts[0].lower())
+            if completion_func:
+                yield from self._get_registered_completions(completion_func, parts)
                 return
 
         # Empty input - only show commands
@@ -248,11 +292,6 @@ class BashCompleter(Completer):
                 command = parts[0].lower()
                 # Special handling for cd - use enhanced completer with nested directory support
                 if command == "cd":
-                    # Update cd completer's current directory dynamically
-                    if hasattr(self, "get_current_dir"):
-                        self.cd_completer.cwd = self.get_current_dir()
-                    else:
-                        self.cd_completer.cwd = self.cwd
                     yield from self.cd_completer.get_completions(document, complete_event)
                 elif command in self.directory_commands:
                     yield from self.path_completer.get_completions(document, complete_event)
@@ -271,11 +310,6 @@ class BashCompleter(Completer):
             command = parts[0].lower()
             # Special handling for cd - use enhanced completer with nested directory support
             if command == "cd":
-                # Update cd completer's current directory dynamically
-                if hasattr(self, "get_current_dir"):
-                    self.cd_completer.cwd = self.get_current_dir()
-                else:
-                    self.cd_completer.cwd = self.cwd
                 yield from self.cd_completer.get_completions(document, complete_event)
             # For other directory commands, suggest directories
             elif command in self.directory_commands:
@@ -296,9 +330,13 @@ class TerminalApp:
         self.current_allowlist = self.config_manager.get_allowlist()
         self.current_blacklist = self.config_manager.get_blacklist()
         self.current_dir = Path.cwd()
-        self.command_history: list[str] = []
+        self._cwd_str = os.fspath(self.current_dir)
+        self.command_history: deque[str] = deque(maxlen=_COMMAND_HISTORY_SIZE)
         self.agent_task: asyncio.Task | None = None
+        self.process: asyncio.subprocess.Process | None = None
         self.console = Console()
+        # "Thinking" animation, built once and reused for every AI request
+        self.spinner = Spinner("dots", text=Text("🤖 ", style=_AI_STYLE), style=_AI_STYLE)
         self.welcome_printed = False
 
         # Set global allowlist/blacklist for tools
@@ -307,9 +345,6 @@ class TerminalApp:
             blacklist=self.current_blacklist if self.current_blacklist else None,
         )
 
-        # Initialize session log
-        initialize_session_log()
-
         # Setup plugin system
         self.plugin_manager = PluginManager()
         self.plugin_manager.register(ZshBindingsPlugin())
@@ -331,12 +366,10 @@ class TerminalApp:
         self.completion_registry.register("git", complete_git, "Git command completion")
         self.completion_registry.register("ros2", complete_ros2, "ROS2 command completion")
 
-        # Setup prompt_toolkit
-        # Pass a function to get current directory dynamically
+        # Setup prompt_toolkit; _set_cwd keeps the completer's cwd in sync
         self.completer = BashCompleter(
             cwd=self.current_dir, completion_registry=self.completion_registry
         )
-        self.completer.get_current_dir = lambda: self.current_dir
         self.history = InMemoryHistory()
 
         # Try to load history from file
@@ -347,6 +380,17 @@ class TerminalApp:
         except Exception:
             self.history = InMemoryHistory()
 
+        # Built-in commands handled in-process, keyed by command name
+        self._builtins = {
+            "cd": self._builtin_cd,
+        }
+        # Argument-less built-ins, matched against the whole command line so
+        # that e.g. "clear && make" still reaches the shell
+        self._exact_builtins = {
+            "clear": self._builtin_clear,
+            "cls": self._builtin_clear,
+        }
+
         # Create key bindings
         self.kb = KeyBindings()
 
@@ -372,14 +416,7 @@ class TerminalApp:
             lexer=PygmentsLexer(BashLexer),
             enable_history_search=True,  # Enable Ctrl+R for reverse search
             search_ignore_case=True,  # Case-insensitive search
-            style=Style.from_dict(
-                {
-                    "completion-menu.completion": "bg:#008888 #ffffff",
-                    "completion-menu.completion.current": "bg:#00aaaa #000000",
-                    "scrollbar.background": "bg:#88aaaa",
-                    "scrollbar.button": "bg:#222222",
-                }
-            ),
+            style=_SESSION_STYLE,
             complete_while_typing=True,  # Show completions while typing
             complete_in_thread=True,  # Don't block on completions
         )
@@ -388,126 +425,223 @@ class TerminalApp:
         """Print welcome message with banner."""
         if not self.welcome_printed:
             print_banner()
-            print(
-                "\033[90m"
-                + "Type commands directly, or use '?' prefix for AI assistance"
-                + "\033[0m"
-            )
-            print("\033[90m" + "Press Ctrl+D to exit" + "\033[0m")
-            print()
+            print(_WELCOME_HINT)
             self.welcome_printed = True
 
-    async def execute_command(self, cmd: str):
-        """Execute a bash command."""
-        global GLOBAL_CWD
+    @contextlib.contextmanager
+    def _on_sigint(self, callback):
+        """Route Ctrl+C to callback while a foreground job is awaited.
 
-        # Handle special built-in commands
-        if cmd == "clear" or cmd == "cls":
-            # Clear screen but preserve welcome message
-            # Move cursor to line after welcome message
-            print("\033[2J\033[H", end="")
-            # Re-print welcome if it was printed before
-            if self.welcome_printed:
-                self.print_welcome()
+        Without this, SIGINT would cancel the main task (or raise out of the
+        event loop) and terminate the whole terminal session.
+        """
+        loop = asyncio.get_running_loop()
+        previous = signal.getsignal(signal.SIGINT)
+        try:
+            loop.add_signal_handler(signal.SIGINT, callback)
+        except (NotImplementedError, RuntimeError):
+            # Signal handlers are unavailable (e.g. Windows or not main thread)
+            yield
             return
+        try:
+            yield
+        finally:
+            loop.remove_signal_handler(signal.SIGINT)
+            signal.signal(signal.SIGINT, previous)
 
+    def _interrupt_process(self):
+        """Terminate the running foreground command."""
+        if self.process and self.process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                self.process.terminate()
+
+    async def _pump_stream(self, stream: asyncio.StreamReader, out: BinaryIO) -> bytes:
+        """Echo a subprocess stream to the terminal as it arrives.
+
+        Whatever is buffered in the pipe is read in one go, so bursts of many
+        short lines are written at once instead of line by line. Flushes are
+        throttled to one per frame; output arriving in between is flushed by a
+        deferred timer so a quiet command never leaves text stuck in the buffer.
+        Bytes are passed through untouched; only the logged copy is decoded.
+
+        Args:
+            stream: The subprocess stdout or stderr reader.
+            out: Binary stream to echo output to.
+
+        Returns:
+            The output read from the stream, for logging. Only the most recent
+            _STREAM_CAPTURE_BYTES (rounded up to whole reads) are kept; when
+            older output was dropped the result starts with a truncation marker.
+        """
+        loop = asyncio.get_running_loop()
+        pending_flush: asyncio.TimerHandle | None = None
+        last_flush = 0.0
+
+        def flush():
+            nonlocal pending_flush, last_flush
+            if pending_flush is not None:
+                pending_flush.cancel()
+                pending_flush = None
+            out.flush()
+            last_flush = loop.time()
+
+        chunks: deque[bytes] = deque()
+        captured = 0
+        truncated = False
+        try:
+            while True:
+                chunk = await stream.read(_STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                captured += len(chunk)
+                while captured - len(chunks[0]) >= _STREAM_CAPTURE_BYTES:
+                    captured -= len(chunks.popleft())
+                    truncated = True
+                out.write(chunk)
+                if loop.time() - last_flush >= _STREAM_FLUSH_INTERVAL:
+                    flush()
+                elif pending_flush is None:
+                    pending_flush = loop.call_later(_STREAM_FLUSH_INTERVAL, flush)
+        finally:
+            flush()
+        if truncated:
+            chunks.appendleft(_STREAM_TRUNCATED_MARKER)
+        return b"".join(chunks)
+
+    def _set_cwd(self, path: Path):
+        """Update the current directory and everything that tracks it.
+
+        The string form is cached so hot paths (subprocess cwd, logging,
+        plugins) don't re-stringify the Path on every command. The agent's
+        bash and ros2 tools read the shared tools cwd, so they follow it too.
+        """
+        self.current_dir = path
+        self._cwd_str = os.fspath(path)
+        tools_globals.GLOBAL_CWD = self._cwd_str
+        # Update completer's current directory
+        self.completer.cwd = path
+        self.completer.cd_completer.cwd = path
+
+    def _builtin_clear(self):
+        """Clear screen but preserve welcome message."""
+        # Move cursor to line after welcome message
+        print("\033[2J\033[H", end="")
+        # Re-print welcome if it was printed before
+        if self.welcome_printed:
+            self.print_welcome()
+
+    def _builtin_cd(self, args: str):
+        """Change the current directory (standard cd behavior)."""
+        new_path = args or "~"
+        try:
+            # Normalise lexically (like the shell's logical cd) instead of
+            # resolve(), which stats every path component to follow symlinks
+            target = os.path.normpath(os.path.join(self._cwd_str, os.path.expanduser(new_path)))
+            if os.path.isdir(target):
+                os.chdir(target)
+                self._set_cwd(Path(target))
+            else:
+                print(f"\033[91mcd: {new_path}: No such file or directory\033[0m")
+        except Exception as e:
+            print(f"\033[91mcd: {str(e)}\033[0m")
+
+    async def execute_command(self, cmd: str):
+        """Execute a bash command."""
         # Try plugins first
-        plugin_result = await self.plugin_manager.execute(cmd, str(self.current_dir))
+        plugin_result = await self.plugin_manager.execute(cmd, self._cwd_str)
         if plugin_result and plugin_result.get("handled", False):
             # Plugin handled the command
             if plugin_result.get("error"):
-                print(f"\033[91m{plugin_result['error']}\033[0m", file=__import__("sys").stderr)
+                print(f"\033[91m{plugin_result['error']}\033[0m", file=sys.stderr)
             if plugin_result.get("output"):
                 print(plugin_result["output"], end="")
             # Update directory if plugin changed it
             if "new_cwd" in plugin_result:
-                self.current_dir = Path(plugin_result["new_cwd"])
-                GLOBAL_CWD = str(self.current_dir)
-                # Update completer's current directory
-                self.completer.cwd = self.current_dir
-                self.completer.cd_completer.cwd = self.current_dir
+                self._set_cwd(Path(plugin_result["new_cwd"]))
             return
 
-        # Handle cd command (standard behavior)
-        if cmd.startswith("cd "):
-            new_path = cmd[3:].strip()
-            if not new_path:
-                new_path = str(Path.home())
-            try:
-                target = (self.current_dir / new_path).resolve()
-                if target.is_dir():
-                    self.current_dir = target
-                    os.chdir(str(self.current_dir))
-                    GLOBAL_CWD = str(self.current_dir)
-                    # Update completer's current directory
-                    self.completer.cwd = self.current_dir
-                    self.completer.cd_completer.cwd = self.current_dir
-                else:
-                    print(f"\033[91mcd: {new_path}: No such file or directory\033[0m")
-            except Exception as e:
-                print(f"\033[91mcd: {str(e)}\033[0m")
+        # Handle built-in commands with a single dict lookup
+        exact_builtin = self._exact_builtins.get(cmd)
+        if exact_builtin is not None:
+            exact_builtin()
+            return
+        name, _, args = cmd.partition(" ")
+        builtin = self._builtins.get(name)
+        if builtin is not None:
+            builtin(args.strip())
             return
 
-        # Execute command using subprocess
+        # Execute command in a subprocess without blocking the event loop
         try:
-            process = subprocess.Popen(
+            self.process = await asyncio.create_subprocess_shell(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                shell=True,
-                cwd=str(self.current_dir),
-            )
-            stdout, stderr = process.communicate()
-
-            # Apply command enhancers
-            enhanced = self.enhancer_manager.enhance(
-                cmd, stdout, stderr, process.returncode, str(self.current_dir)
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self._cwd_str,
             )
-
-            # Log terminal output (original, not enhanced)
-            log_terminal_output(
+            process = self.process
+            assert process.stdout is not None and process.stderr is not None
+            # Enhancers rewrite the complete output, so only stream when none apply
+            buffered = self.enhancer_manager.should_enhance(cmd)
+            try:
+                with self._on_sigint(self._interrupt_process):
+                    if buffered:
+                        stdout_b, stderr_b = await process.communicate()
+                        exit_code = await process.wait()
+                    else:
+                        # Flush pending text output before writing raw bytes
+                        sys.stdout.flush()
+                        sys.stderr.flush()
+                        stdout_b, stderr_b, exit_code = await asyncio.gather(
+                            self._pump_stream(process.stdout, sys.stdout.buffer),
+                            self._pump_stream(process.stderr, sys.stderr.buffer),
+                            process.wait(),
+                        )
+            finally:
+                self.process = None
+            stdout = stdout_b.decode(errors="replace")
+            stderr = stderr_b.decode(errors="replace")
+
+            if buffered:
+                # Apply command enhancers and display enhanced output
+                enhanced = self.enhancer_manager.enhance(
+                    cmd, stdout, stderr, exit_code, self._cwd_str
+                )
+                if enhanced["stdout"]:
+                    print(enhanced["stdout"], end="")
+                if enhanced["stderr"]:
+                    print(enhanced["stderr"], end="", file=sys.stderr)
+                # Display hints if any, in a single write
+                if enhanced.get("hints"):
+                    print("\n".join(f"\033[33m💡 {hint}\033[0m" for hint in enhanced["hints"]))
+
+            # Log terminal output (original, not enhanced) off the event loop
+            await asyncio.to_thread(
+                log_terminal_output,
                 command=cmd,
                 stdout=stdout,
                 stderr=stderr,
-                exit_code=process.returncode,
-                cwd=str(self.current_dir),
+                exit_code=exit_code,
+                cwd=self._cwd_str,
             )
 
-            # Display enhanced output
-            if enhanced["stdout"]:
-                print(enhanced["stdout"], end="")
-            if enhanced["stderr"]:
-                print(enhanced["stderr"], end="", file=__import__("sys").stderr)
-            # Display hints if any
-            if enhanced.get("hints"):
-                for hint in enhanced["hints"]:
-                    print(f"\033[33m💡 {hint}\033[0m")
-
-            # Update directory if command changed it
-            try:
-                new_cwd = Path.cwd()
-                if new_cwd != self.current_dir:
-                    self.current_dir = new_cwd
-                    GLOBAL_CWD = str(self.current_dir)
-                    # Update completer's current directory
-                    self.completer.cwd = self.current_dir
-                    self.completer.cd_completer.cwd = self.current_dir
-            except Exception:
-                pass
-
         except Exception as e:
             error_msg = f"\033[91mError executing command: {e}\033[0m"
-            print(error_msg, file=__import__("sys").stderr)
-            log_terminal_error(command=cmd, error=str(e), cwd=str(self.current_dir))
+            print(error_msg, file=sys.stderr)
+            await asyncio.to_thread(
+                log_terminal_error, command=cmd, error=str(e), cwd=self._cwd_str
+            )
 
     def _format_response(self, response: str):
-        """Format AI response with proper code block rendering."""
-        # Check if response contains code blocks
-        code_block_pattern = r"```(\w+)?\n?(.*?)```"
+        """Format AI response with proper code block rendering.
 
-        # Find all code blocks
-        matches = list(re.finditer(code_block_pattern, response, re.DOTALL))
+        All segments are collected into one renderable group and printed in a
+        single pass, so the reply is rendered and written once rather than once
+        per prose/code segment.
+        """
+        # Find all code blocks (skip the regex scan when there cannot be any)
+        matches = list(_CODE_BLOCK_RE.finditer(response)) if "```" in response else []
 
         if not matches:
             # No code blocks, just print as markdown
@@ -515,36 +649,40 @@ class TerminalApp:
             return
 
         # Process response with code blocks
+        renderables = []
         last_end = 0
         for match in matches:
-            # Print text before code block
+            # Text before code block
             if match.start() > last_end:
                 text_before = response[last_end : match.start()].strip()
                 if text_before:
-                    self.console.print(Markdown(text_before))
+                    renderables.append(Markdown(text_before))
 
             # Extract language and code
             language = match.group(1) or "text"
             code = match.group(2).strip()
 
-            # Print code block with syntax highlighting
+            # Code block with syntax highlighting
             # Use a terminal-friendly theme
-            syntax = Syntax(
-                code,
-                language,
-                theme="one-dark",
-                line_numbers=False,
-                word_wrap=True,
+            renderables.append(
+                Syntax(
+                    code,
+                    language,
+                    theme="one-dark",
+                    line_numbers=False,
+                    word_wrap=True,
+                )
             )
-            self.console.print(syntax)
 
             last_end = match.end()
 
-        # Print remaining text after last code block
+        # Remaining text after last code block
         if last_end < len(response):
             text_after = response[last_end:].strip()
             if text_after:
-                self.console.print(Markdown(text_after))
+                renderables.append(Markdown(text_after))
+
+        self.console.print(Group(*renderables))
 
     async def handle_ai_request(self, prompt: str):
         """Handle an AI assistance request."""
@@ -553,31 +691,49 @@ class TerminalApp:
         blacklist = self.current_blacklist if self.current_blacklist else None
 
         # Log user request
-        log_conversation("user", prompt)
-
-        # Create spinner animation
-        spinner_text = Text("🤖 ", style="cyan")
-        spinner = Spinner("dots", text=spinner_text, style="cyan")
+        await asyncio.to_thread(log_conversation, "user", prompt)
 
         try:
             # Display spinner in a Live context
-            with Live(spinner, console=self.console, refresh_per_second=10, transient=True):
-                # Run agent
-                response = await run_agent(
-                    prompt,
-                    allowed_commands=allowlist,
-                    blacklisted_commands=blacklist,
+            with Live(self.spinner, console=self.console, refresh_per_second=10, transient=True):
+                # Imported on first use so the shell starts without loading the
+                # agent stack; the spinner is already up while it loads
+                from ..runner import run_agent
+
+                # Run agent as a task so Ctrl+C can cancel it without ending the session
+                self.agent_task = asyncio.create_task(
+                    run_agent(
+                        prompt,
+                        allowed_commands=allowlist,
+                        blacklisted_commands=blacklist,
+                    )
                 )
+                with self._on_sigint(self.agent_task.cancel):
+                    # wait() neither raises when the agent is cancelled nor
+                    # cancels it if this coroutine is, unlike awaiting the task
+                    await asyncio.wait({self.agent_task})
+
+            if self.agent_task.cancelled():
+                print("^C")
+                return
 
             # Display AI response with formatting
-            self.console.print("[cyan]🤖[/cyan]", end=" ")
+            response = self.agent_task.result()
+            self.console.print(Text("🤖", style=_AI_STYLE), end=" ")
             self._format_response(response)
 
         except Exception as e:
-            self.console.print(f"[red]❌ AI Error: {e}[/red]")
+            # Text is never parsed as markup, so the message needs no escaping
+            self.console.print(Text(f"❌ AI Error: {e}", style=_ERROR_STYLE))
+        finally:
+            if self.agent_task and not self.agent_task.done():
+                self.agent_task.cancel()
+            self.agent_task = None
 
     async def run(self):
         """Run the terminal application."""
+        # Initialize session log (file I/O, kept off the event loop)
+        await asyncio.to_thread(initialize_session_log)
         self.print_welcome()
 
         try:
@@ -589,20 +745,14 @@ class TerminalApp:
                     if not command.strip():
                         continue
 
-                    # Add to command history
-                    if self.command_history and self.command_history[-1] != command:
-                        self.command_history.append(command)
-                    elif not self.command_history:
+                    # Add to command history, skipping consecutive duplicates
+                    if not self.command_history or self.command_history[-1] != command:
                         self.command_history.append(command)
 
-                    # Limit history size
-                    if len(self.command_history) > 1000:
-                        self.command_history.pop(0)
-
-                    # Check if it's an AI request
-                    if command.startswith(AI_PREFIX):
+                    # Check if it's an AI request (slice compare avoids a method call)
+                    if command[:_AI_PREFIX_LEN] == AI_PREFIX:
                         # Remove prefix and send to AI
-                        ai_prompt = command[1:].strip()
+                        ai_prompt = command[_AI_PREFIX_LEN:].strip()
                         if ai_prompt:
                             await self.handle_ai_request(ai_prompt)
                         else:
@@ -621,10 +771,24 @@ class TerminalApp:
                     break
 
         finally:
-            log_session_end()
+            await asyncio.to_thread(log_session_end)
 
 
 def run_tui():
-    """Run the terminal TUI application."""
+    """Run the terminal TUI application.
+
+    Uses uvloop's libuv-based event loop when it is installed, which lowers the
+    per-callback overhead of the prompt, subprocess streaming and spinner timers.
+    uvloop.run() only exists from uvloop 0.18, so older installs use asyncio.run().
+    """
     app = TerminalApp()
-    asyncio.run(app.run())
+    try:
+        import uvloop
+    except ImportError:
+        uvloop_run = None
+    else:
+        uvloop_run = getattr(uvloop, "run", None)
+    if uvloop_run is None:
+        asyncio.run(app.run())
+    else:
+        uvloop_run(app.run())
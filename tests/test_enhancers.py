@@ -79,3 +79,15 @@ def test_ls_color_enhancer_get_file_color_symlink(tmp_path):
 
     color = enhancer._get_file_color(symlink, tmp_path)
     assert enhancer.CYAN in color
+
+
+def test_ls_color_enhancer_get_file_color_by_extension(tmp_path):
+    """Test _get_file_color matches extensions case-insensitively and defaults to reset."""
+    enhancer = LsColorEnhancer()
+    image = tmp_path / "photo.PNG"
+    image.touch()
+    plain = tmp_path / "notes.txt"
+    plain.touch()
+
+    assert enhancer._get_file_color(image, tmp_path) == enhancer.MAGENTA
+    assert enhancer._get_file_color(plain, tmp_path) == enhancer.RESET
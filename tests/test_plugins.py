@@ -95,6 +95,14 @@ async def test_zsh_bindings_plugin_should_not_handle():
     assert plugin.should_handle("ls") is False
     assert plugin.should_handle("cd /tmp") is False
     assert plugin.should_handle("cd ..") is False
+    assert plugin.should_handle("cd ... extra") is False
+    assert plugin.should_handle("cdx ...") is False
+
+
+def test_zsh_bindings_plugin_should_handle_dots_with_extra_spaces():
+    """Test ZshBindingsPlugin accepts dots patterns separated by several spaces."""
+    plugin = ZshBindingsPlugin()
+    assert plugin.should_handle("cd  .../") is True
 
 
 def test_ls_color_enhancer_name():
@@ -157,3 +165,13 @@ def test_enhancer_manager_enhance():
     assert "stdout" in result
     assert "stderr" in result
     assert "hints" in result
+
+
+def test_enhancer_manager_should_enhance():
+    """Test enhancer manager should_enhance method."""
+    manager = EnhancerManager()
+    assert manager.should_enhance("ls") is False
+
+    manager.register(LsColorEnhancer())
+    assert manager.should_enhance("ls -la") is True
+    assert manager.should_enhance("echo hello") is False
@@ -501,3 +501,4 @@ def test_get_current_datetime():
     assert len(result["date"]) == 10  # YYYY-MM-DD
     assert len(result["time"]) == 8  # HH:MM:SS
     assert "UTC" in result["utc_datetime"]
+    assert result["local_datetime"] == f"{result['date']} {result['time']}"
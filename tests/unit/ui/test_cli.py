@@ -1,11 +1,12 @@
 """Unit tests for CLI (agent command, tui command)."""
 
-from unittest.mock import patch
+import asyncio
+from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
-from flouri.ui.cli import cli
+from flouri.ui.cli import STREAM_FLUSH_INTERVAL, _StreamPrinter, cli
 
 
 @pytest.fixture
@@ -15,7 +16,7 @@ def runner():
 
 def test_agent_command_standard_mode(runner):
     """agent command calls run_agent_sync and prints response."""
-    with patch("flouri.ui.cli.run_agent_sync", return_value="**Done**"):
+    with patch("flouri.runner.run_agent_sync", return_value="**Done**"):
         result = runner.invoke(cli, ["agent", "list files"])
     assert result.exit_code == 0
     assert "Done" in result.output or "**" in result.output
@@ -23,7 +24,7 @@ def test_agent_command_standard_mode(runner):
 
 def test_agent_command_with_allowlist_blacklist(runner):
     """agent command parses --allowlist and --blacklist."""
-    with patch("flouri.ui.cli.run_agent_sync", return_value="ok") as mock_run:
+    with patch("flouri.runner.run_agent_sync", return_value="ok") as mock_run:
         runner.invoke(cli, ["agent", "-a", "ls, pwd", "-b", " rm ", "hello"])
     mock_run.assert_called_once()
     call_kw = mock_run.call_args[1]
@@ -33,7 +34,7 @@ def test_agent_command_with_allowlist_blacklist(runner):
 
 def test_agent_command_stream_mode(runner):
     """agent command with --stream calls run_agent_live_sync."""
-    with patch("flouri.ui.cli.run_agent_live_sync", return_value="streamed") as mock_run:
+    with patch("flouri.runner.run_agent_live_sync", return_value="streamed") as mock_run:
         result = runner.invoke(cli, ["agent", "--stream", "hello"])
     assert result.exit_code == 0
     mock_run.assert_called_once()
@@ -42,7 +43,7 @@ def test_agent_command_stream_mode(runner):
 
 def test_agent_command_exception_exits_one(runner):
     """agent command exits 1 when run_agent_sync raises."""
-    with patch("flouri.ui.cli.run_agent_sync", side_effect=RuntimeError("API error")):
+    with patch("flouri.runner.run_agent_sync", side_effect=RuntimeError("API error")):
         result = runner.invoke(cli, ["agent", "fail"])
     assert result.exit_code == 1
 
@@ -73,7 +74,47 @@ def test_agent_command_stream_callback_invoked(runner):
             stream_callback("chunk2")
         return "done"
 
-    with patch("flouri.ui.cli.run_agent_live_sync", side_effect=call_stream_callback):
+    with patch("flouri.runner.run_agent_live_sync", side_effect=call_stream_callback):
         result = runner.invoke(cli, ["agent", "--stream", "hello"])
     assert result.exit_code == 0
     assert "chunk1" in result.output and "chunk2" in result.output
+
+
+@pytest.mark.asyncio
+async def test_stream_printer_coalesces_chunks_within_a_frame(monkeypatch):
+    """Chunks arriving before the scheduled flush are written with a single print."""
+    out = MagicMock()
+    printer = _StreamPrinter(out)
+    call_later = MagicMock()
+    monkeypatch.setattr(asyncio.get_running_loop(), "call_later", call_later)
+
+    printer("chunk1")
+    printer("chunk2")
+    out.print.assert_not_called()
+    call_later.assert_called_once_with(STREAM_FLUSH_INTERVAL, printer.flush)
+
+    # Run the scheduled flush; the next chunk schedules a new one
+    printer.flush()
+    out.print.assert_called_once_with("chunk1chunk2", end="", markup=False)
+    printer("chunk3")
+    assert call_later.call_count == 2
+
+
+def test_stream_printer_writes_immediately_without_a_loop():
+    """Outside an event loop there is nothing to defer to, so each chunk is printed."""
+    out = MagicMock()
+    printer = _StreamPrinter(out)
+
+    printer("chunk1")
+    out.print.assert_called_once_with("chunk1", end="", markup=False)
+
+
+def test_stream_printer_flush_writes_pending_text():
+    """flush() writes buffered text and is a no-op when nothing is pending."""
+    out = MagicMock()
+    printer = _StreamPrinter(out)
+    printer._pending.append("tail")
+
+    printer.flush()
+    printer.flush()
+    out.print.assert_called_once_with("tail", end="", markup=False)
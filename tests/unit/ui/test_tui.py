@@ -0,0 +1,321 @@
+"""Unit tests for the TUI terminal app."""
+
+import asyncio
+import io
+import os
+import shutil
+import subprocess
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+from rich.console import Console
+
+from flouri.tools import globals as tools_globals
+from flouri.ui.tui import TerminalApp, get_git_info, run_tui
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+class _FlushRecordingSink(io.BytesIO):
+    """BytesIO that records how often it was flushed and what had been flushed."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+        self.flushed = b""
+
+    def flush(self):
+        self.flushes += 1
+        self.flushed = self.getvalue()
+        super().flush()
+
+
+def _git(cwd, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _init_repo(path, branch: str = "main", commit: bool = True):
+    path.mkdir(parents=True, exist_ok=True)
+    _git(path, "init", "-q", "-b", branch)
+    if commit:
+        (path / "file.txt").write_text("one\n")
+        _git(path, "add", "file.txt")
+        _git(path, "commit", "-q", "-m", "first")
+    return path
+
+
+def test_get_git_info_outside_a_repository(tmp_path):
+    """No branch and no status are shown outside a git repository."""
+    assert get_git_info(tmp_path) == ("", "")
+
+
+@requires_git
+def test_get_git_info_clean_and_dirty_tree(tmp_path):
+    """The branch is shown with '+' for a clean tree and '*' once it has changes."""
+    repo = _init_repo(tmp_path / "repo", branch="feature/x")
+    assert get_git_info(repo) == ("(feature/x)", "+")
+
+    (repo / "file.txt").write_text("two\n")
+    assert get_git_info(repo) == ("(feature/x)", "*")
+
+
+@requires_git
+def test_get_git_info_detached_head(tmp_path):
+    """A detached HEAD is shown as (HEAD), like rev-parse --abbrev-ref."""
+    repo = _init_repo(tmp_path / "repo")
+    _git(repo, "checkout", "-q", "--detach")
+    assert get_git_info(repo) == ("(HEAD)", "+")
+
+
+@requires_git
+def test_get_git_info_strips_upstream_tracking(tmp_path):
+    """The '...origin/branch [ahead N]' part of the header is not shown."""
+    upstream = _init_repo(tmp_path / "upstream")
+    clone = tmp_path / "clone"
+    _git(tmp_path, "clone", "-q", str(upstream), str(clone))
+    (clone / "file.txt").write_text("two\n")
+    _git(clone, "commit", "-q", "-am", "second")
+    assert get_git_info(clone) == ("(main)", "+")
+
+
+@requires_git
+def test_get_git_info_repository_without_commits(tmp_path):
+    """A freshly initialised repository shows its unborn branch."""
+    repo = _init_repo(tmp_path / "repo", branch="trunk", commit=False)
+    assert get_git_info(repo) == ("(trunk)", "+")
+
+    (repo / "new.txt").write_text("x\n")
+    assert get_git_info(repo) == ("(trunk)", "*")
+
+
+@pytest.fixture
+def app():
+    # _pump_stream needs no app state, so skip the config/plugin setup in __init__
+    return TerminalApp.__new__(TerminalApp)
+
+
+async def _pump(app, cmd: str, sink: io.BytesIO) -> bytes:
+    process = await asyncio.create_subprocess_shell(
+        cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+    )
+    assert process.stdout is not None
+    captured, _ = await asyncio.gather(app._pump_stream(process.stdout, sink), process.wait())
+    return captured
+
+
+@pytest.mark.asyncio
+async def test_pump_stream_echoes_and_returns_output(app):
+    """Everything the command prints is echoed to the sink and returned for logging."""
+    sink = io.BytesIO()
+    captured = await _pump(app, "printf 'one\\ntwo\\n'", sink)
+    assert sink.getvalue() == b"one\ntwo\n"
+    assert captured == b"one\ntwo\n"
+
+
+@pytest.mark.asyncio
+async def test_pump_stream_passes_raw_bytes_through(app):
+    """Non-UTF-8 bytes reach the terminal untouched."""
+    sink = io.BytesIO()
+    captured = await _pump(app, "printf '\\377\\376ok'", sink)
+    assert sink.getvalue() == b"\xff\xfeok"
+    assert captured == b"\xff\xfeok"
+
+
+@pytest.mark.asyncio
+async def test_pump_stream_flushes_output_of_a_quiet_command(app):
+    """Output is flushed even when the command goes quiet before exiting."""
+    sink = _FlushRecordingSink()
+    script = "import time\nprint('early', flush=True)\ntime.sleep(5)"
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", script, stdout=asyncio.subprocess.PIPE
+    )
+    assert process.stdout is not None
+    pump = asyncio.ensure_future(app._pump_stream(process.stdout, sink))
+
+    async def line_flushed():
+        while sink.flushed != b"early\n":
+            await asyncio.sleep(0.01)
+
+    try:
+        # The line is echoed and flushed while the command is still running
+        await asyncio.wait_for(line_flushed(), timeout=2)
+        assert process.returncode is None
+    finally:
+        process.kill()
+        await asyncio.gather(pump, process.wait())
+
+
+@pytest.mark.asyncio
+async def test_pump_stream_coalesces_flushes_for_bursty_output(app):
+    """A command writing many small chunks triggers far fewer flushes than writes."""
+    sink = _FlushRecordingSink()
+    script = "import sys\nfor i in range(200): print(i, flush=True)"
+    captured = await _pump(app, f"{sys.executable} -c '{script}'", sink)
+    assert captured == "".join(f"{i}\n" for i in range(200)).encode()
+    assert sink.flushes < 200
+
+
+@pytest.mark.asyncio
+async def test_pump_stream_keeps_all_output_of_a_slow_producer(app):
+    """A command delivering one small read per line is captured in full, not per chunk."""
+    sink = io.BytesIO()
+    script = (
+        "import time\n"
+        "for i in range(600):\n"
+        "    print(f'line{i}', flush=True)\n"
+        "    time.sleep(0.001)"
+    )
+    captured = await _pump(app, f'{sys.executable} -c "{script}"', sink)
+    assert captured == sink.getvalue()
+    assert captured.startswith(b"line0\n")
+    assert captured.endswith(b"line599\n")
+
+
+@pytest.mark.asyncio
+async def test_pump_stream_marks_truncated_capture(app, monkeypatch):
+    """Past the byte cap, the oldest output is dropped from the log copy and marked."""
+    monkeypatch.setattr("flouri.ui.tui._STREAM_CAPTURE_BYTES", 16)
+    sink = io.BytesIO()
+    script = (
+        "import time\n"
+        "for i in range(20):\n"
+        "    print(f'line{i:02}', flush=True)\n"
+        "    time.sleep(0.001)"
+    )
+    captured = await _pump(app, f'{sys.executable} -c "{script}"', sink)
+    # The terminal still gets everything
+    assert sink.getvalue() == b"".join(f"line{i:02}\n".encode() for i in range(20))
+    assert captured.startswith(b"[output truncated]\n")
+    body = captured.removeprefix(b"[output truncated]\n")
+    assert len(body) >= 16
+    assert sink.getvalue().endswith(body)
+    assert not sink.getvalue().startswith(body)
+
+
+def test_set_cwd_updates_the_agent_tools_cwd(app, tmp_path, monkeypatch):
+    """A TUI directory change is visible to the agent's bash and ros2 tools."""
+    monkeypatch.setattr(tools_globals, "GLOBAL_CWD", "/")
+    app.completer = MagicMock()
+
+    app._set_cwd(tmp_path)
+
+    assert app.current_dir == tmp_path
+    assert tools_globals.GLOBAL_CWD == str(tmp_path)
+    assert app.completer.cd_completer.cwd == tmp_path
+
+
+@pytest.fixture
+def cd_app(app, tmp_path, monkeypatch):
+    """Bare app rooted at tmp_path, with os.chdir and the tools cwd restored afterwards."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tools_globals, "GLOBAL_CWD", str(tmp_path))
+    app.completer = MagicMock()
+    app.current_dir = tmp_path
+    app._cwd_str = str(tmp_path)
+    return app
+
+
+def test_builtin_cd_expands_home(cd_app, tmp_path, monkeypatch):
+    """cd ~/x goes to x under the home directory."""
+    home = tmp_path / "home"
+    (home / "x").mkdir(parents=True)
+    monkeypatch.setenv("HOME", str(home))
+
+    cd_app._builtin_cd("~/x")
+
+    assert cd_app.current_dir == home / "x"
+    assert tools_globals.GLOBAL_CWD == str(home / "x")
+
+
+def test_builtin_cd_follows_the_typed_path_through_symlinks(cd_app, tmp_path):
+    """cd link/.. returns to the directory holding the link, not the target's parent."""
+    (tmp_path / "elsewhere" / "target").mkdir(parents=True)
+    (tmp_path / "here").mkdir()
+    (tmp_path / "here" / "link").symlink_to(tmp_path / "elsewhere" / "target")
+
+    cd_app._builtin_cd("here/link/..")
+
+    assert cd_app.current_dir == tmp_path / "here"
+    assert tools_globals.GLOBAL_CWD == str(tmp_path / "here")
+
+
+def test_builtin_cd_missing_directory_keeps_cwd(cd_app, tmp_path, capsys):
+    """cd into a missing directory prints an error and leaves the cwd alone."""
+    cd_app._builtin_cd("missing")
+
+    assert "cd: missing: No such file or directory" in capsys.readouterr().out
+    assert cd_app.current_dir == tmp_path
+    assert tools_globals.GLOBAL_CWD == str(tmp_path)
+    assert os.getcwd() == str(tmp_path)
+
+
+@pytest.fixture
+def shell_app(tmp_path, monkeypatch):
+    """Fully initialised app with its home, cwd and tool globals isolated to the test."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(tmp_path)
+    for name in ("GLOBAL_CWD", "GLOBAL_ALLOWLIST", "GLOBAL_BLACKLIST"):
+        monkeypatch.setattr(tools_globals, name, getattr(tools_globals, name))
+    return TerminalApp()
+
+
+@pytest.fixture
+def fake_clear(tmp_path, monkeypatch):
+    """Put a no-op `clear` on PATH so the shell can run it without a terminal."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    clear = bin_dir / "clear"
+    clear.write_text("#!/bin/sh\nexit 0\n")
+    clear.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+@pytest.mark.asyncio
+async def test_clear_alone_is_handled_in_process(shell_app, tmp_path, capsys):
+    """A bare clear is handled by the built-in instead of spawning a shell."""
+    await shell_app.execute_command("clear")
+    assert capsys.readouterr().out.startswith("\033[2J\033[H")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cmd", ["clear && touch ran", "cls foo; touch ran"])
+async def test_clear_with_more_input_runs_in_the_shell(shell_app, fake_clear, tmp_path, cmd):
+    """clear/cls followed by anything else is passed to the shell, so the rest still runs."""
+    await shell_app.execute_command(cmd)
+    assert (tmp_path / "ran").exists()
+
+
+@pytest.mark.asyncio
+async def test_ai_request_reports_agent_import_failure(shell_app, monkeypatch):
+    """A failing agent-stack import is reported as an AI error instead of ending the session."""
+    monkeypatch.setattr("flouri.ui.tui.log_conversation", MagicMock())
+    # A None entry makes `from ..runner import run_agent` raise ImportError
+    monkeypatch.setitem(sys.modules, "flouri.runner", None)
+    shell_app.console = Console(file=io.StringIO(), width=200)
+
+    await shell_app.handle_ai_request("hello")
+
+    assert "❌ AI Error" in shell_app.console.file.getvalue()
+    assert shell_app.agent_task is None
+
+
+def test_run_tui_falls_back_to_asyncio_for_old_uvloop(monkeypatch):
+    """A uvloop without run() (before 0.18) does not stop the TUI from starting."""
+    app = MagicMock()
+    monkeypatch.setattr("flouri.ui.tui.TerminalApp", lambda: app)
+    monkeypatch.setitem(sys.modules, "uvloop", types.ModuleType("uvloop"))
+    asyncio_run = MagicMock()
+    monkeypatch.setattr(asyncio, "run", asyncio_run)
+
+    run_tui()
+
+    asyncio_run.assert_called_once_with(app.run.return_value)